@@ -0,0 +1,22 @@
+import os
+from functools import lru_cache
+from diskcache import Cache
+from artist_data.config import load_env
+
+load_env()
+
+# Directory of the on-disk cache of fetched artist data
+ARTIST_CACHE_DIR = os.getenv('ARTIST_CACHE_DIR', '.artist_cache')
+
+# Time (in seconds) after which cached artist data expires, one day by default
+ARTIST_CACHE_TTL = int(os.getenv('ARTIST_CACHE_TTL', 24 * 60 * 60))
+
+@lru_cache(maxsize=None)
+def get_artist_cache() -> Cache:
+    """
+    Open the on-disk cache of fetched artist data, creating it on first use.
+
+    Returns:
+        diskcache.Cache: The cache stored in ARTIST_CACHE_DIR.
+    """
+    return Cache(ARTIST_CACHE_DIR)
@@ -1,2 +1,3 @@
+from artist_data.client.session import create_session
 from artist_data.client.genius_client import create_genius_client
 from artist_data.client.spotify_client import create_spotify_client
\ No newline at end of file
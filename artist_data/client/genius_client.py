@@ -1,11 +1,12 @@
 import os
 import lyricsgenius
-from dotenv import load_dotenv
+from artist_data.config import load_env
 
-load_dotenv('../../.env')
+load_env()
 
 # Utility function
 from artist_data.utils import suppress_stdout
+from artist_data.client.session import create_session
 
 # Define custom exceptions for Genius Client
 class GeniusClientError(Exception):
@@ -43,6 +44,14 @@ def create_genius_client() -> lyricsgenius.genius.Genius:
                                      sleep_time=0.5,
                                      retries=5)
 
+        # Route requests through a pooled session, keeping lyricsgenius' headers.
+        # lyricsgenius only retries timeouts, so the adapter retries rate-limited (429) and 5xx responses
+        # (honoring Retry-After) but leaves connection retries to lyricsgenius.
+        session = create_session(retries=0, status_retries=5)
+        session.headers.update(genius._session.headers)
+        genius._session.close()
+        genius._session = session
+
         # Perform a test call to ensure the token is valid
         try:
             with suppress_stdout():
@@ -0,0 +1,91 @@
+import json
+from typing import Optional
+import requests
+import requests.models
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from artist_data.setup import MAX_CONCURRENT_REQUESTS
+
+# Optional, faster JSON parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+class OrjsonCompat:
+    """Stand-in for the `json` module used by requests, parsing with orjson and delegating everything else to `json`."""
+
+    @staticmethod
+    def loads(s, **kwargs):
+        # orjson takes no options: fall back to the stdlib when a caller passes some
+        return json.loads(s, **kwargs) if kwargs else orjson.loads(s)
+
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+# Parse every response body (spotipy and lyricsgenius both go through Response.json) with orjson when installed
+if orjson is not None:
+    requests.models.complexjson = OrjsonCompat()
+
+def create_session(pool_connections: int = 20,
+                   pool_maxsize: int = MAX_CONCURRENT_REQUESTS,
+                   retries: int = 5,
+                   status_retries: Optional[int] = None,
+                   backoff_factor: float = 0.3,
+                   cache_name: Optional[str] = None,
+                   expire_after: int = 120) -> requests.Session:
+    """
+    Create a requests session backed by a pooled, retrying HTTP adapter.
+
+    Connections are kept alive and reused across calls, so the TCP and TLS handshakes are paid once per
+    connection instead of once per request. The pool keeps one connection per concurrent worker (see
+    `map_concurrently()`): concurrent API calls reuse their connections instead of discarding them after use,
+    without holding more idle connections to the servers than can ever be in use.
+
+    If `cache_name` is given, the session is also an HTTP cache (SQLite backed) that honors the servers'
+    Cache-Control headers, so repeated GET requests within their lifetime are answered locally.
+
+    Args:
+        pool_connections (int, optional): Number of host pools to cache. Defaults to 20.
+        pool_maxsize (int, optional): Maximum number of connections kept per host. Defaults to MAX_CONCURRENT_REQUESTS.
+        retries (int, optional): Number of retries on connection errors. Defaults to 5.
+        status_retries (Optional[int], optional): Number of retries on retryable status codes (429 and 5xx), honoring
+            their Retry-After header. Defaults to `retries`.
+        backoff_factor (float, optional): Backoff factor applied between retries. Defaults to 0.3.
+        cache_name (Optional[str], optional): Path of the HTTP cache database, None to disable caching. Defaults to None.
+        expire_after (int, optional): Lifetime in seconds of cached responses without Cache-Control headers. Defaults to 120.
+
+    Returns:
+        requests.Session: Session with the pooled adapter mounted for HTTP and HTTPS.
+    """
+    if status_retries is None:
+        status_retries = retries
+
+    retry = Retry(total=max(retries, status_retries),
+                  connect=retries,
+                  read=False,
+                  status=status_retries,
+                  allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+                  backoff_factor=backoff_factor,
+                  status_forcelist=RETRY_STATUS_CODES)
+
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          max_retries=retry)
+
+    if cache_name:
+        session = requests_cache.CachedSession(cache_name,
+                                               backend='sqlite',
+                                               cache_control=True,
+                                               expire_after=expire_after)
+    else:
+        session = requests.Session()
+
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
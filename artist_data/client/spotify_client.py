@@ -1,10 +1,14 @@
 import os
-from dotenv import load_dotenv
+from artist_data.config import load_env
 
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
 
-load_dotenv('../../.env')
+# Pooled HTTP session
+from artist_data.client.session import create_session
+from artist_data.cache import ARTIST_CACHE_DIR
+
+load_env()
 
 # Define custom exceptions for Spotify Client
 class SpotifyClientError(Exception):
@@ -39,11 +43,15 @@ def create_spotify_client() -> spotipy.Spotify:
             raise InvalidCredentialsError("Spotify client credentials are missing or invalid. "
                                           "Please set the CLIENT_ID_SPOTIFY and CLIENT_SECRET_SPOTIFY environment variables.")
 
-        # Initialize Spotify client
+        # Initialize Spotify client, sharing one pooled session between token requests and API calls.
+        # GET responses (search, albums, ...) are cached according to Spotify's Cache-Control headers.
+        session = create_session(cache_name=os.path.join(ARTIST_CACHE_DIR, 'spotify_http_cache'))
         client_credentials_manager = SpotifyClientCredentials(client_id=client_id,
-                                                              client_secret=client_secret)
+                                                              client_secret=client_secret,
+                                                              requests_session=session)
         
-        spotify = spotipy.Spotify(client_credentials_manager=client_credentials_manager)
+        spotify = spotipy.Spotify(client_credentials_manager=client_credentials_manager,
+                                  requests_session=session)
 
         # Perform a test call to ensure the credentials are valid
         try:
@@ -0,0 +1,15 @@
+from functools import lru_cache
+from dotenv import load_dotenv, find_dotenv
+
+@lru_cache(maxsize=None)
+def load_env() -> bool:
+    """
+    Load the project's .env file into the environment variables, once per process.
+
+    The file is searched from the current working directory upwards, so the credentials are found wherever the
+    code is run from in the project (root, notebooks, ...). Variables already set in the environment are kept.
+
+    Returns:
+        bool: True if a .env file was found and loaded, False otherwise.
+    """
+    return load_dotenv(find_dotenv(usecwd=True))
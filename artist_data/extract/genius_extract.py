@@ -1,11 +1,12 @@
 import pandas as pd
-from tqdm import tqdm
 import lyricsgenius
-from typing import Dict, Any, List, Tuple
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple
 
 # Utility function
-from artist_data.setup import UNKNOWN_VALUE
-from artist_data.utils import safe_get, safe_extract
+from artist_data.setup import UNKNOWN_VALUE, GENIUS_MAX_CONCURRENT_SONGS
+from artist_data.cache import get_artist_cache, ARTIST_CACHE_TTL
+from artist_data.utils import safe_get, safe_extract, extract_fields, map_concurrently, maybe_tqdm
 
 # Custom exceptions
 class GeniusAPIError(Exception):
@@ -20,15 +21,31 @@ class TrackDataError(GeniusAPIError):
     """Custom exception for track data issues."""
     pass
 
+# Track fields taken as-is from a Genius track result: (output name, key path)
+GENIUS_TRACK_FIELDS = (
+    ('genius_track_id', ('id',)),
+    ('genius_title', ('title',)),
+    ('genius_release_date', ('release_date',)),
+    ('genius_album', ('album',)),
+    ('genius_track_api_path', ('api_path',)),
+    ('genius_pageviews', ('stats', 'pageviews')),
+    ('genius_track_url', ('url',)),
+    ('genius_track_image_url', ('song_art_image_url',)),
+    ('genius_track_language', ('language',)),
+    ('genius_track_description', ('description', 'plain')),
+    ('genius_lyrics', ('lyrics',)),
+    ('genius_lyrics_is_complete', ('lyrics_state',)),
+)
+
 # Genius Functions
-def genius_artist_search(genius_client: lyricsgenius.Genius, artist_name: str, n_tracks: int = 10) -> Dict[str, Any]:
+def genius_artist_search(genius_client: lyricsgenius.Genius, artist_name: str, n_tracks: Optional[int] = 10) -> Dict[str, Any]:
     """
     Search for an artist on Genius by their name.
 
     Args:
         genius_client (lyricsgenius.Genius): Genius API client.
         artist_name (str): Name of the artist to search for.
-        n_tracks (int, optional): Number of tracks to retrieve. Defaults to 10.
+        n_tracks (Optional[int], optional): Number of tracks to retrieve, None for all of them. Defaults to 10.
 
     Returns:
         Dict[str, Any]: The artist's data as a dictionary.
@@ -38,14 +55,84 @@ def genius_artist_search(genius_client: lyricsgenius.Genius, artist_name: str, n
         GeniusAPIError: If there is an error fetching the artist's data.
     """
     try:
-        artist = genius_client.search_artist(artist_name, max_songs=n_tracks, get_full_info=True)
-        if not artist or safe_get(artist.to_dict(), 'name') != artist_name:
+        # Only resolve the artist here: lyricsgenius would then fetch each song one after the other
+        artist = genius_client.search_artist(artist_name, max_songs=0)
+        if artist is None or artist.name != artist_name:
             raise ArtistNotFoundError(f"Artist '{artist_name}' not found on Genius.")
-        return artist.to_dict()
+
+        songs = get_genius_artist_songs(genius_client, artist.id, artist.name, n_tracks)
+        return {
+            **artist.to_dict(),
+            'songs': map_concurrently(partial(get_genius_song, genius_client), songs,
+                                      max_concurrency=GENIUS_MAX_CONCURRENT_SONGS, desc="Fetching songs")
+        }
     except Exception as e:
         raise GeniusAPIError(f"Error fetching artist '{artist_name}' from Genius API: {str(e)}")
 
 
+def get_genius_artist_songs(genius_client: lyricsgenius.Genius, artist_id: int, artist_name: str,
+                            n_tracks: Optional[int] = 10, sort: str = 'popularity') -> List[Dict[str, Any]]:
+    """
+    List the songs of an artist on Genius, keeping the same songs as `Genius.search_artist()` would.
+
+    Non-songs (track lists, liner notes, ...) are skipped if the client is configured to, as well as songs by 
+    other primary artists and duplicated titles.
+
+    Args:
+        genius_client (lyricsgenius.Genius): Genius API client.
+        artist_id (int): Genius ID of the artist.
+        artist_name (str): Name of the artist on Genius.
+        n_tracks (Optional[int], optional): Number of songs to retrieve, None for all of them. Defaults to 10.
+        sort (str, optional): Sort order of the songs, 'popularity' or 'title'. Defaults to 'popularity'.
+
+    Returns:
+        List[Dict[str, Any]]: The songs as listed by the artist songs endpoint (without lyrics or full info).
+    """
+    songs = []
+    titles = set()
+    page = 1
+
+    while page is not None and (n_tracks is None or len(songs) < n_tracks):
+        songs_on_page = genius_client.artist_songs(artist_id, per_page=50, page=page, sort=sort)
+
+        for song_info in songs_on_page['songs']:
+            if genius_client.skip_non_songs and not genius_client._result_is_lyrics(song_info):
+                continue
+            if song_info['title'] in titles or song_info['primary_artist']['name'] != artist_name:
+                continue
+
+            titles.add(song_info['title'])
+            songs.append(song_info)
+            if n_tracks is not None and len(songs) >= n_tracks:
+                break
+
+        page = songs_on_page['next_page']
+
+    return songs
+
+
+def get_genius_song(genius_client: lyricsgenius.Genius, song_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Complete a song listed by Genius with its full info and lyrics.
+
+    The result has the same shape as `lyricsgenius.types.Song.to_dict()`.
+
+    Args:
+        genius_client (lyricsgenius.Genius): Genius API client.
+        song_info (Dict[str, Any]): The song as listed by the artist songs endpoint.
+
+    Returns:
+        Dict[str, Any]: The song's full info, with its 'artist' and 'lyrics'.
+    """
+    if song_info['lyrics_state'] == 'complete':
+        lyrics = genius_client.lyrics(song_url=song_info['url'])
+    else:
+        lyrics = ""
+
+    song = {**song_info, **genius_client.song(song_info['id'])['song']}
+    return {**song, 'artist': song['primary_artist']['name'], 'lyrics': lyrics or ""}
+
+
 def build_genius_artist_data(genius_artist_search_result: Dict[str, Any]) -> Dict[str, Any]:
     """
     Build a structured dictionary with artist information and track data.
@@ -74,7 +161,7 @@ def build_genius_artist_data(genius_artist_search_result: Dict[str, Any]) -> Dic
             'genius_is_verified': safe_get(genius_artist_search_result, 'is_verified'),
             'genius_tracks': [
                 build_genius_artist_track(track)
-                for track in tqdm(safe_get(genius_artist_search_result, 'songs', {}), desc= "Processing tracks")
+                for track in maybe_tqdm(safe_get(genius_artist_search_result, 'songs', {}), desc= "Processing tracks")
             ]
         }
     except Exception as e:
@@ -102,18 +189,7 @@ def build_genius_artist_track(genius_artist_track: Dict[str, Any]) -> Dict[str,
         primary_artists = safe_get(genius_artist_track, 'primary_artists', [])
 
         return {
-            'genius_track_id': safe_get(genius_artist_track, 'id'),
-            'genius_title': safe_get(genius_artist_track, 'title'),
-            'genius_release_date': safe_get(genius_artist_track, 'release_date'),
-            'genius_album': safe_get(genius_artist_track, 'album'),
-            'genius_track_api_path': safe_get(genius_artist_track, 'api_path'),
-            'genius_pageviews': safe_extract(genius_artist_track, ['stats', 'pageviews']),
-            'genius_track_url': safe_get(genius_artist_track, 'url'),
-            'genius_track_image_url': safe_get(genius_artist_track, 'song_art_image_url'),
-            'genius_track_language': safe_get(genius_artist_track, 'language'),
-            'genius_track_description': safe_extract(genius_artist_track, ["description", "plain"]),
-            'genius_lyrics': safe_get(genius_artist_track, 'lyrics'),
-            'genius_lyrics_is_complete': safe_get(genius_artist_track, 'lyrics_state'),
+            **extract_fields(genius_artist_track, GENIUS_TRACK_FIELDS),
             'primary_artist': primary_artist,
             'primary_artists': [
                 safe_get(artist, 'name')
@@ -126,14 +202,19 @@ def build_genius_artist_track(genius_artist_track: Dict[str, Any]) -> Dict[str,
         raise TrackDataError(f"Error occurred while building track data: {str(e)}")
 
 
-def fetch_genius_artist_data(genius_client: lyricsgenius.Genius, artist_name: str, n_tracks: int = 10) -> Dict[str, Any]:
+def fetch_genius_artist_data(genius_client: lyricsgenius.Genius, artist_name: str, n_tracks: Optional[int] = 10,
+                             use_cache: bool = True) -> Dict[str, Any]:
     """
     Fetch artist data from Genius and build a combined dictionary with artist details and tracks.
 
+    The result is stored in the on-disk artist cache for ARTIST_CACHE_TTL seconds, so fetching the same 
+    artist again does not hit the API.
+
     Args:
         genius_client (lyricsgenius.Genius): Genius API client.
         artist_name (str): Name of the artist to search for.
-        n_tracks (int, optional): Number of tracks to fetch from Genius. Defaults to 10.
+        n_tracks (Optional[int], optional): Number of tracks to fetch from Genius, None for all of them. Defaults to 10.
+        use_cache (bool, optional): Whether to read from and write to the artist cache. Defaults to True.
 
     Returns:
         Dict[str, Any]: A combined dictionary with artist details and tracks.
@@ -143,15 +224,29 @@ def fetch_genius_artist_data(genius_client: lyricsgenius.Genius, artist_name: st
         ArtistNotFoundError: If the artist is not found.
         TrackDataError: If there is an error processing track data.
     """
+    cache_key = ('genius', artist_name, n_tracks)
+    if use_cache:
+        cached_result = get_artist_cache().get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
     try:
         genius_artist = genius_artist_search(genius_client, artist_name, n_tracks)
         genius_artist_data = build_genius_artist_data(genius_artist)
 
-        return {
-            'artist_data': {key: value for key, value in genius_artist_data.items() if key != 'genius_tracks'},
-            'artist_tracks': safe_get(genius_artist_data, 'genius_tracks', {})
+        # Split the tracks out of the freshly built artist data, without copying the rest
+        artist_tracks = genius_artist_data.pop('genius_tracks', [])
+
+        result = {
+            'artist_data': genius_artist_data,
+            'artist_tracks': artist_tracks
         }
     except (GeniusAPIError, ArtistNotFoundError, TrackDataError) as e:
         raise e
     except Exception as e:
-        raise GeniusAPIError(f"Unexpected error: {str(e)}")
\ No newline at end of file
+        raise GeniusAPIError(f"Unexpected error: {str(e)}")
+
+    if use_cache:
+        get_artist_cache().set(cache_key, result, expire=ARTIST_CACHE_TTL)
+
+    return result
\ No newline at end of file
@@ -1,31 +1,71 @@
 import pandas as pd
-from tqdm import tqdm
 import spotipy
-from typing import Dict, Any, List
+from copy import deepcopy
+from functools import partial
+from cachetools import cached, LRUCache, TTLCache
+from cachetools.keys import hashkey
+from typing import Dict, Any, Iterator, List, Tuple
 
 # Utility function
 from artist_data.setup import UNKNOWN_VALUE
-from artist_data.utils import safe_get, safe_extract, flat_nested_dictionary
+from artist_data.cache import get_artist_cache, ARTIST_CACHE_TTL
+from artist_data.utils import safe_get, safe_extract, extract_fields, map_concurrently, maybe_tqdm
+
+# Track fields taken as-is from a Spotify album track: (output name, key path)
+SPOTIFY_TRACK_FIELDS = (
+    ('spotify_track_id', ('id',)),
+    ('spotify_track_name', ('name',)),
+    ('spotify_track_uri', ('uri',)),
+    ('spotify_track_url', ('href',)),
+    ('track_number', ('track_number',)),
+    ('spotify_album_id', ('spotify_album_id',)),
+)
+
+# In-memory caches of Spotify lookups, keyed on the artist only so that they do not keep the clients alive
+SPOTIFY_SEARCH_CACHE = TTLCache(maxsize=2048, ttl=600)
+SPOTIFY_RELATED_ARTISTS_CACHE = LRUCache(maxsize=1024)
 
 def spotify_artist_search(spotify_client: spotipy.Spotify, artist_name: str) -> Dict[str, Any]:
     """
     Search for an artist on Spotify by their name.
     
+    Results are cached for 10 minutes, since popularity and follower counts change over time.
+    Each call returns its own copy of the cached result.
+    
     :param spotify_client: Spotify API client
     :param artist_name: Name of the artist to search for
     :return: The first matching artist's Spotify data
     :raises: ValueError if no artist is found
     """
-    spotify_artist_search_result = safe_extract(
-        spotify_client.search(artist_name, type='artist'), 
-        ['artists', 'items'], 
-        None
-    )
+    spotify_artist = SPOTIFY_SEARCH_CACHE.get(artist_name)
     
-    if spotify_artist_search_result:
-        return spotify_artist_search_result[0]
+    if spotify_artist is None:
+        spotify_artist_search_result = safe_extract(
+            spotify_client.search(artist_name, type='artist'), 
+            ['artists', 'items'], 
+            None
+        )
+        
+        if not spotify_artist_search_result:
+            raise ValueError(f"No artist found with the name '{artist_name}'")
+        
+        spotify_artist = SPOTIFY_SEARCH_CACHE[artist_name] = spotify_artist_search_result[0]
     
-    raise ValueError(f"No artist found with the name '{artist_name}'")
+    return deepcopy(spotify_artist)
+
+@cached(SPOTIFY_RELATED_ARTISTS_CACHE, key=lambda spotify_client, artist_id: hashkey(artist_id))
+def get_related_artists_names(spotify_client: spotipy.Spotify, artist_id: str) -> Tuple[str, ...]:
+    """
+    Retrieves the names of the artists related to a Spotify artist.
+    
+    Results are cached per artist ID, so repeated lookups do not hit the API.
+    
+    :param spotify_client: Spotify API client
+    :param artist_id: Spotify artist ID
+    :return: A tuple with the names of the related artists
+    """
+    return tuple(safe_get(artist_related, 'name') for artist_related in
+                 safe_get(spotify_client.artist_related_artists(artist_id), 'artists'))
 
 def build_spotify_artist_data(spotify_client: spotipy.Spotify, spotify_artist_search_result: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -35,41 +75,54 @@ def build_spotify_artist_data(spotify_client: spotipy.Spotify, spotify_artist_se
     :param spotify_artist_search_result: The artist data returned by a Spotify search
     :return: A dictionary with artist details such as ID, name, genres, and popularity
     """
+    # Artists without pictures have no (or an empty) 'images' list
+    images = spotify_artist_search_result.get('images') or []
+    image_url = images[0].get('url', UNKNOWN_VALUE) if images else UNKNOWN_VALUE
+    
     return {
         'spotify_artist_id': safe_get(spotify_artist_search_result, 'id'),
         'spotify_artist_name': safe_get(spotify_artist_search_result, 'name'),
         'spotify_artist_uri_path': safe_get(spotify_artist_search_result, 'uri'),
         'spotify_artist_url': safe_get(spotify_artist_search_result, 'href'),
-        'spotify_artist_image_url': safe_get(safe_get(spotify_artist_search_result, 'images')[0], 'url'),
+        'spotify_artist_image_url': image_url,
         'spotify_artist_n_followers': safe_extract(spotify_artist_search_result, ['followers', 'total']),
         'spotify_popularity': safe_get(spotify_artist_search_result, 'popularity'),
         'spotify_artist_genres': safe_get(spotify_artist_search_result, 'genres'),
-        'spotify_related_artists': [safe_get(artist_related, 'name') for artist_related in 
-                                    safe_get(spotify_client.artist_related_artists(safe_get(spotify_artist_search_result, 'id')), 'artists')]
+        'spotify_related_artists': list(get_related_artists_names(spotify_client, safe_get(spotify_artist_search_result, 'id')))
     }
 
-def get_artist_albums(spotify_client: spotipy.Spotify, artist_id: str, album_types: List[str] = ['album', 'single']) -> List:
+def iter_artist_albums(spotify_client: spotipy.Spotify, artist_id: str, album_types: List[str] = ['album', 'single']) -> Iterator[Dict[str, Any]]:
     """
-    Retrieves all albums (including singles) from a Spotify artist.
+    Iterates over all albums (including singles) from a Spotify artist, page by page.
     
     :param spotify_client: Spotify API client
     :param artist_id: Spotify artist ID
     :param album_types: Types of albums to retrieve ('album', 'single', etc.)
-    :return: A list of albums (with no duplicates)
+    :return: An iterator over the albums, each album ID being yielded once
     """
-    albums = []
+    seen_album_ids = set()
     results = spotify_client.artist_albums(artist_id, album_type=','.join(album_types), limit=50)
     
     while results:
-        albums.extend(results['items'])
+        for album in results['items']:
+            if album['id'] not in seen_album_ids:
+                seen_album_ids.add(album['id'])
+                yield album
         if results['next']:
             results = spotify_client.next(results)
         else:
             break
+
+def get_artist_albums(spotify_client: spotipy.Spotify, artist_id: str, album_types: List[str] = ['album', 'single']) -> List:
+    """
+    Retrieves all albums (including singles) from a Spotify artist.
     
-    # Remove duplicates by album ID
-    unique_albums = {album['id']: album for album in albums}.values()
-    return list(unique_albums)
+    :param spotify_client: Spotify API client
+    :param artist_id: Spotify artist ID
+    :param album_types: Types of albums to retrieve ('album', 'single', etc.)
+    :return: A list of albums (with no duplicates)
+    """
+    return list(iter_artist_albums(spotify_client, artist_id, album_types))
 
 def get_album_tracks(spotify_client: spotipy.Spotify, album_id: str) -> List[Dict[str, Any]]:
     """
@@ -98,17 +151,36 @@ def get_all_tracks_of_artist(spotify_client: spotipy.Spotify, artist_id: str) ->
     :param spotify_client: Spotify API client
     :param artist_id: Spotify artist ID
     :return: A list of all tracks by the artist
+    
+    The album tracks are fetched concurrently, one request per album, since the calls are I/O-bound.
     """
-    all_tracks = []
-    albums = get_artist_albums(spotify_client, artist_id)
+    album_ids = [safe_get(album, 'id') for album in iter_artist_albums(spotify_client, artist_id)]
     
-    for album in tqdm(albums, desc="Fetching album tracks"):
-        album_id = safe_get(album, 'id')
-        tracks = get_album_tracks(spotify_client, album_id)
-        tracks = [{**track, 'spotify_album_id': album_id} for track in tracks]
-        all_tracks.extend(tracks)
+    albums_tracks = map_concurrently(partial(get_album_tracks, spotify_client), album_ids, desc="Fetching album tracks")
     
-    return all_tracks
+    return [
+        {**track, 'spotify_album_id': album_id}
+        for album_id, tracks in zip(album_ids, albums_tracks)
+        for track in tracks
+    ]
+
+def get_tracks_audio_features(spotify_client: spotipy.Spotify, track_ids: List[str], batch_size: int = 100) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieves the audio features of many tracks, batching the requests.
+    
+    :param spotify_client: Spotify API client
+    :param track_ids: Spotify track IDs
+    :param batch_size: Number of IDs per request (the endpoint accepts at most 100)
+    :return: A dictionary mapping each track ID to its audio features
+    """
+    features_by_id = {}
+    
+    for i in range(0, len(track_ids), batch_size):
+        for features in spotify_client.audio_features(track_ids[i:i + batch_size]):
+            if features:
+                features_by_id[features['id']] = features
+    
+    return features_by_id
 
 def build_spotify_artist_tracks(spotify_client: spotipy.Spotify, spotify_artist_id: str) -> List[Dict[str, Any]]:
     """
@@ -116,39 +188,54 @@ def build_spotify_artist_tracks(spotify_client: spotipy.Spotify, spotify_artist_
     
     :param spotify_client: Spotify API client
     :param spotify_artist_id: Spotify artist ID
-    :return: A list of dictionaries with track details and audio features
+    :return: A list of dictionaries with track details and audio features (one per track ID)
     """
-    tracks = get_all_tracks_of_artist(spotify_client, spotify_artist_id)
+    tracks = []
+    track_ids = []
+    seen_track_ids = set()
+    
+    # A track can be listed on several albums (e.g. a single and its album): keep its first occurrence only
+    for track in get_all_tracks_of_artist(spotify_client, spotify_artist_id):
+        track_id = safe_get(track, 'id')
+        if track_id != UNKNOWN_VALUE:
+            if track_id in seen_track_ids:
+                continue
+            seen_track_ids.add(track_id)
+            track_ids.append(track_id)
+        tracks.append(track)
+    
+    features_by_id = get_tracks_audio_features(spotify_client, track_ids)
     spotify_artist_tracks = []
 
-    for track in tqdm(tracks, desc="Processing tracks"):
+    for track in maybe_tqdm(tracks, desc="Processing tracks"):
+        # The audio features are merged directly into the track's dictionary
         spotify_artist_tracks.append({
             "spotify_artist_id": spotify_artist_id,
-            "spotify_track_id": safe_get(track, 'id'),
-            "spotify_track_name": safe_get(track, 'name'),
-            "spotify_track_uri": safe_get(track, 'uri'),
-            "spotify_track_url": safe_get(track, 'href'),
-            "track_number": safe_get(track, 'track_number'),
-            "spotify_album_id": safe_get(track, 'spotify_album_id'),
-            "track_audio_features_spotify": spotify_client.audio_features(safe_get(track, 'id'))[0] if safe_get(track, 'id') != UNKNOWN_VALUE else {}
+            **extract_fields(track, SPOTIFY_TRACK_FIELDS),
+            **features_by_id.get(safe_get(track, 'id'), {})
         })
-    
-    # Flatten the nested 'track_audio_features_spotify' into the main dictionary
-    spotify_artist_tracks = [flat_nested_dictionary(track, 'track_audio_features_spotify') for track in spotify_artist_tracks]
 
     return spotify_artist_tracks
 
-def fetch_spotify_artist_data(spotify_client: spotipy.Spotify, artist_name: str) -> Dict[str, Any]:
+def fetch_spotify_artist_data(spotify_client: spotipy.Spotify, artist_name: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Fetches both the metadata and tracks of an artist from Spotify.
     
     This function integrates the steps of searching for the artist, retrieving artist details, 
     and fetching all tracks (along with their audio features).
+    The result is stored in the on-disk artist cache for ARTIST_CACHE_TTL seconds.
     
     :param spotify_client: Spotify API client
     :param artist_name: Name of the artist to search for
+    :param use_cache: Whether to read from and write to the artist cache
     :return: A dictionary containing artist metadata and their tracks
     """
+    cache_key = ('spotify', artist_name)
+    if use_cache:
+        cached_result = get_artist_cache().get(cache_key)
+        if cached_result is not None:
+            return cached_result
+    
     # Step 1: Search for the artist by name
     spotify_artist_search_result = spotify_artist_search(spotify_client, artist_name)
     
@@ -158,8 +245,13 @@ def fetch_spotify_artist_data(spotify_client: spotipy.Spotify, artist_name: str)
     # Step 3: Build and retrieve the artist's tracks
     spotify_artist_tracks = build_spotify_artist_tracks(spotify_client, spotify_artist_data['spotify_artist_id'])
     
-    # Return both artist data and tracks
-    return {
+    result = {
         'artist_data': spotify_artist_data,
         'artist_tracks': spotify_artist_tracks
-    }
\ No newline at end of file
+    }
+    
+    if use_cache:
+        get_artist_cache().set(cache_key, result, expire=ARTIST_CACHE_TTL)
+    
+    # Return both artist data and tracks
+    return result
\ No newline at end of file
@@ -1 +1,8 @@
-UNKNOWN_VALUE = 'UNFOUND'
\ No newline at end of file
+UNKNOWN_VALUE = 'UNFOUND'
+
+# Maximum number of API requests in flight at once (Spotify/Genius rate limits)
+MAX_CONCURRENT_REQUESTS = 10
+
+# Maximum number of Genius songs fetched at once: lyricsgenius sleeps 0.5s after each request,
+# but per thread, so each worker adds up to ~2 requests per second
+GENIUS_MAX_CONCURRENT_SONGS = 2
\ No newline at end of file
@@ -1,9 +1,14 @@
 import sys, os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, List, Optional, Sequence, Tuple
+from tqdm import tqdm
 
 # Define a constant for unknown values
-from artist_data.setup import UNKNOWN_VALUE
+from artist_data.setup import UNKNOWN_VALUE, MAX_CONCURRENT_REQUESTS
+
+# Sentinel for missing keys, compared by identity
+_MISSING = object()
 
 @contextmanager
 def suppress_stdout():
@@ -52,13 +57,12 @@ def extract_value(data: Dict[str, Any], key_path: list, UNKNOWN_VALUE: Any = UNK
     """
     value = data
 
-    try:
-        for key in key_path:
-            value = safe_get(value, key, UNKNOWN_VALUE)
-            if value == UNKNOWN_VALUE:
-                break
-    except AttributeError:
-        return UNKNOWN_VALUE
+    for key in key_path:
+        if not isinstance(value, dict):
+            return UNKNOWN_VALUE
+        value = value.get(key, _MISSING)
+        if value is _MISSING:
+            return UNKNOWN_VALUE
 
     return value if value else UNKNOWN_VALUE
 
@@ -81,10 +85,88 @@ def safe_extract(data: Dict[str, Any], key_path: list, UNKNOWN_VALUE: Any = UNKN
     """
     return extract_value(data, key_path, UNKNOWN_VALUE)
 
+def extract_fields(data: Dict[str, Any], fields: Sequence[Tuple[str, Tuple[str, ...]]], UNKNOWN_VALUE: Any = UNKNOWN_VALUE) -> Dict[str, Any]:
+    """
+    Builds a flat dictionary from a (nested) dictionary using a declarative field mapping.
+
+    Each field is an `(output_name, key_path)` pair. A single-key path behaves like `safe_get()`, and a longer 
+    path behaves like `safe_extract()`. The lookups are done inline with `dict.get`, so building a record costs 
+    one function call instead of one per field.
+
+    Args:
+        data (Dict[str, Any]): The dictionary to extract the values from.
+        fields (Sequence[Tuple[str, Tuple[str, ...]]]): The output names and the key paths to their values.
+        UNKNOWN_VALUE (Any, optional): The value to use when a key path is missing. Defaults to 'UNKNOWN'.
+
+    Returns:
+        Dict[str, Any]: A dictionary mapping each output name to its extracted value.
+    """
+    record = {}
+
+    for name, key_path in fields:
+        value = data
+        for key in key_path:
+            if not isinstance(value, dict):
+                value = UNKNOWN_VALUE
+                break
+            value = value.get(key, UNKNOWN_VALUE)
+
+        if len(key_path) > 1 and not value:
+            value = UNKNOWN_VALUE
+
+        record[name] = value
+
+    return record
+
 def flat_nested_dictionary(d: Dict, parent_key: str) -> Dict:
     """Flattens a nested dictionary under a specific key into the parent dictionary."""
     nested_dict = safe_get(d, parent_key, {})
     if isinstance(nested_dict, dict):
         d.update(nested_dict)
     d.pop(parent_key, None)
-    return d
\ No newline at end of file
+    return d
+
+
+def progress_enabled() -> bool:
+    """
+    Tells whether progress bars should be displayed.
+
+    Progress bars are only useful when someone is watching: they are shown on an interactive terminal or in a 
+    Jupyter notebook, unless the NO_PROGRESS environment variable is set.
+
+    Returns:
+        bool: True if progress bars should be displayed.
+    """
+    if os.environ.get('NO_PROGRESS'):
+        return False
+    return sys.stderr.isatty() or 'ipykernel' in sys.modules
+
+
+def maybe_tqdm(iterable: Iterable[Any], **kwargs: Any) -> Iterable[Any]:
+    """Wraps `iterable` in a tqdm progress bar if `progress_enabled()`, otherwise returns it unchanged."""
+    return tqdm(iterable, **kwargs) if progress_enabled() else iterable
+
+
+def map_concurrently(func: Callable[[Any], Any], items: Iterable[Any],
+                     max_concurrency: int = MAX_CONCURRENT_REQUESTS, desc: Optional[str] = None) -> List[Any]:
+    """
+    Applies a blocking function to every item concurrently and collects the results.
+
+    The calls are dispatched at once to a pool of worker threads, so that blocking I/O (e.g. API calls made 
+    through spotipy or lyricsgenius) overlaps instead of running back to back. The pool size caps the number 
+    of calls in flight to respect the APIs' rate limits. Unlike an asyncio event loop, a thread pool can also 
+    be used from code that already runs inside one, such as a Jupyter notebook.
+
+    Args:
+        func (Callable[[Any], Any]): The blocking function to apply to each item.
+        items (Iterable[Any]): The items to process.
+        max_concurrency (int, optional): Maximum number of calls running at once. Defaults to MAX_CONCURRENT_REQUESTS.
+        desc (Optional[str], optional): Description shown on the progress bar. Defaults to None.
+
+    Returns:
+        List[Any]: The results of `func`, in the same order as `items`.
+    """
+    items = list(items)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        return list(maybe_tqdm(executor.map(func, items), total=len(items), desc=desc))
\ No newline at end of file